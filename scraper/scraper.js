@@ -1,5 +1,6 @@
 import puppeteer from 'puppeteer';
 import fs from 'fs';
+import net from 'net';
 import path from 'path';
 import { fileURLToPath } from 'url';
 import https from 'https';
@@ -11,8 +12,9 @@ const __dirname = path.dirname(__filename);
 const DEBUG = process.env.DEBUG === 'true';
 
 const config = {
-  downloadDir: path.resolve(__dirname, './downloads'),
+  downloadDir: path.resolve(process.env.DOWNLOAD_DIR || path.join(__dirname, 'downloads')),
   timeout: 60000,
+  requestTimeout: 300000,
   headless: !DEBUG,
 };
 
@@ -103,7 +105,34 @@ function downloadFile(url, filepath) {
   });
 }
 
-async function scrapeTaskCards(page, browser, shouldDownload) {
+// Compact summary for the Python CLI, so it doesn't have to parse the full JSON:
+// "WSM1" <u16 title_len><title> <u32 cards><u32 files><u32 images><u32 links>
+// then <u16 name_len><name> per file. All integers little-endian, strings UTF-8.
+function writeManifest(manifestPath, data) {
+  const clip = (value) => {
+    const buf = Buffer.from(String(value ?? ''), 'utf8');
+    return buf.length > 0xFFFF ? buf.subarray(0, 0xFFFF) : buf;
+  };
+  const withLength = (buf) => {
+    const len = Buffer.alloc(2);
+    len.writeUInt16LE(buf.length);
+    return [len, buf];
+  };
+
+  const counts = Buffer.alloc(16);
+  counts.writeUInt32LE(data.cards?.length || 0, 0);
+  counts.writeUInt32LE(data.files?.length || 0, 4);
+  counts.writeUInt32LE(data.images?.length || 0, 8);
+  counts.writeUInt32LE(data.links?.length || 0, 12);
+
+  const parts = [Buffer.from('WSM1'), ...withLength(clip(data.title)), counts];
+  for (const file of data.files || []) {
+    parts.push(...withLength(clip(file.name ?? 'unknown')));
+  }
+  fs.writeFileSync(manifestPath, Buffer.concat(parts));
+}
+
+async function scrapeTaskCards(page, browser, shouldDownload, downloadDir) {
   console.log('Detected TaskCards page, using specialized scraping...');
 
   await page.waitForSelector('[class*="card"], [class*="Card"]', { timeout: config.timeout })
@@ -292,11 +321,13 @@ async function scrapeTaskCards(page, browser, shouldDownload) {
     let failedCount = 0;
 
     for (const [filename, url] of capturedUrls.entries()) {
+      // The daemon closes the page when a request times out; stop writing then.
+      if (page.isClosed()) break;
       try {
         console.log(`  Downloading: ${filename}`);
 
         const safeName = filename.replace(/[<>:"/\\|?*]/g, '_');
-        const tempPath = path.join(config.downloadDir, safeName);
+        const tempPath = path.join(downloadDir, safeName);
 
         await downloadFile(url, tempPath);
 
@@ -310,7 +341,7 @@ async function scrapeTaskCards(page, browser, shouldDownload) {
           const correctExt = extMap[actualType] || `.${actualType}`;
           const baseName = safeName.replace(/\.[^.]+$/, '');
           const newName = `${baseName}${correctExt}`;
-          const newPath = path.join(config.downloadDir, newName);
+          const newPath = path.join(downloadDir, newName);
 
           fs.renameSync(tempPath, newPath);
           console.log(`    ⚠ Saved as ${newName} (content is ${actualType}, not ${expectedType})`);
@@ -382,13 +413,175 @@ async function scrapeGeneric(page) {
   return data;
 }
 
+function launchBrowser(headless) {
+  return puppeteer.launch({
+    headless: headless ? 'new' : false,
+    args: ['--no-sandbox', '--disable-setuid-sandbox']
+  });
+}
+
+// Scrape one URL with an already-running browser, writing the screenshot,
+// scrape-results.json and manifest.bin. Only the page is closed afterwards.
+// With a timeout (ms), the page is closed when it expires so a hung scrape
+// stops touching downloadDir, and the returned promise rejects.
+async function scrapeUrl(browser, url, { shouldDownload, downloadDir, resultsPath, manifestPath, timeout }) {
+  console.log(`\nScraping: ${url}\n`);
+
+  if (!fs.existsSync(downloadDir)) {
+    fs.mkdirSync(downloadDir, { recursive: true });
+  }
+
+  const page = await browser.newPage();
+  let timer;
+  try {
+    const scrape = scrapePage(page, browser, url, { shouldDownload, downloadDir, resultsPath, manifestPath });
+    if (!timeout) return await scrape;
+    const expired = new Promise((_, reject) => {
+      timer = setTimeout(() => reject(new Error(`Scrape timed out after ${timeout / 1000} seconds`)), timeout);
+    });
+    return await Promise.race([scrape, expired]);
+  } finally {
+    clearTimeout(timer);
+    await page.close();
+  }
+}
+
+async function scrapePage(page, browser, url, { shouldDownload, downloadDir, resultsPath, manifestPath }) {
+  await page.setViewport({ width: 1920, height: 1080 });
+  await page.setUserAgent('Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36');
+
+  console.log('Loading page...');
+  await page.goto(url, { waitUntil: 'networkidle2', timeout: config.timeout });
+  console.log('Page loaded, extracting content...\n');
+
+  let data;
+  if (url.includes('taskcards.de')) {
+    data = await scrapeTaskCards(page, browser, shouldDownload, downloadDir);
+  } else {
+    data = await scrapeGeneric(page);
+  }
+
+  const screenshotPath = path.join(downloadDir, 'page-screenshot.png');
+  await page.screenshot({ path: screenshotPath, fullPage: true });
+  console.log(`Screenshot saved: ${screenshotPath}`);
+
+  console.log('\n=== SCRAPE RESULTS ===\n');
+  console.log(`Title: ${data.title}`);
+  if (data.cards?.length > 0) console.log(`\nCards found: ${data.cards.length}`);
+  console.log(`\nImages found: ${data.images?.length || 0}`);
+  console.log(`Links found: ${data.links?.length || 0}`);
+  console.log(`\nDownloadable files: ${data.files?.length || 0}`);
+
+  if (data.files?.length > 0) {
+    console.log('\nFiles:');
+    data.files.forEach((file, i) => console.log(`  ${i + 1}. ${file.name}`));
+  }
+
+  fs.writeFileSync(resultsPath, JSON.stringify(data, null, 2));
+  console.log(`\nFull results saved: ${resultsPath}`);
+
+  writeManifest(manifestPath, data);
+
+  return data;
+}
+
+// Long-lived mode: keep one headless browser warm and serve scrape requests
+// over a Unix socket. Each connection sends one JSON line and gets one back:
+//   {"url", "download", "downloadDir", "resultsFile", "manifestFile", "timeout"?} -> {"ok", "error"?}
+// "timeout" is in seconds. If the browser dies the daemon exits, removing the
+// socket, so clients fall back to running the scraper themselves.
+//   {"command": "ping" | "stop"} -> {"ok": true}
+async function runDaemon(socketPath) {
+  const browser = await launchBrowser(true);
+
+  if (fs.existsSync(socketPath)) fs.unlinkSync(socketPath);
+
+  const server = net.createServer((socket) => {
+    let buffer = '';
+    socket.on('data', async (chunk) => {
+      buffer += chunk;
+      const newline = buffer.indexOf('\n');
+      if (newline === -1) return;
+      socket.removeAllListeners('data');
+
+      const reply = (message) => socket.end(JSON.stringify(message) + '\n');
+      let request;
+      try {
+        request = JSON.parse(buffer.slice(0, newline));
+      } catch (err) {
+        reply({ ok: false, error: `Invalid request: ${err.message}` });
+        return;
+      }
+
+      if (request.command === 'ping') {
+        reply({ ok: true });
+        return;
+      }
+      if (request.command === 'stop') {
+        reply({ ok: true });
+        shutdown();
+        return;
+      }
+
+      try {
+        await scrapeUrl(browser, request.url, {
+          shouldDownload: Boolean(request.download),
+          downloadDir: path.resolve(request.downloadDir),
+          resultsPath: request.resultsFile,
+          manifestPath: request.manifestFile,
+          timeout: request.timeout ? request.timeout * 1000 : config.requestTimeout,
+        });
+        reply({ ok: true });
+      } catch (err) {
+        console.error('Error:', err.message);
+        reply({ ok: false, error: err.message });
+      }
+    });
+    socket.on('error', (err) => console.error('Socket error:', err.message));
+  });
+
+  let stopping = false;
+  async function shutdown() {
+    if (stopping) return;
+    stopping = true;
+    console.log('Stopping daemon...');
+    server.close();
+    await browser.close();
+    if (fs.existsSync(socketPath)) fs.unlinkSync(socketPath);
+    process.exit(0);
+  }
+  process.on('SIGINT', shutdown);
+  process.on('SIGTERM', shutdown);
+  browser.on('disconnected', () => {
+    if (stopping) return;
+    stopping = true;
+    console.error('Browser disconnected, stopping daemon');
+    server.close();
+    if (fs.existsSync(socketPath)) fs.unlinkSync(socketPath);
+    process.exit(1);
+  });
+
+  server.listen(socketPath, () => console.log(`Daemon listening on ${socketPath}`));
+}
+
 async function main() {
+  if (process.argv[2] === '--daemon') {
+    const socketPath = process.argv[3];
+    if (!socketPath) {
+      console.log('Usage: node scraper.js --daemon <socket path>');
+      process.exit(1);
+    }
+    await runDaemon(path.resolve(socketPath));
+    return;
+  }
+
   const url = process.argv[2];
   const shouldDownload = process.env.DOWNLOAD === 'true';
 
   if (!url) {
     console.log(`
 Usage: node scraper.js <URL> [options]
+       node scraper.js --daemon <socket path>
 
 Examples:
   node scraper.js "https://www.taskcards.de/#/board/..."
@@ -396,8 +589,11 @@ Examples:
   DOWNLOAD=true node scraper.js "https://example.com"
 
 Options:
-  DEBUG=true     - Show browser window
-  DOWNLOAD=true  - Download files
+  DEBUG=true         - Show browser window
+  DOWNLOAD=true      - Download files
+  DOWNLOAD_DIR=path  - Directory for downloads and screenshot
+  RESULTS_FILE=path  - Where to write scrape-results.json
+  MANIFEST_FILE=path - Where to write the binary results summary
 
 Note: TaskCards serves JPEG preview images instead of actual PDFs.
       The scraper will detect and rename these preview files.
@@ -405,57 +601,19 @@ Note: TaskCards serves JPEG preview images instead of actual PDFs.
     process.exit(1);
   }
 
-  console.log(`\nScraping: ${url}\n`);
-
-  if (!fs.existsSync(config.downloadDir)) {
-    fs.mkdirSync(config.downloadDir, { recursive: true });
-  }
-
-  const browser = await puppeteer.launch({
-    headless: config.headless ? 'new' : false,
-    args: ['--no-sandbox', '--disable-setuid-sandbox']
-  });
+  const browser = await launchBrowser(config.headless);
 
   try {
-    const page = await browser.newPage();
-    await page.setViewport({ width: 1920, height: 1080 });
-    await page.setUserAgent('Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36');
-
-    console.log('Loading page...');
-    await page.goto(url, { waitUntil: 'networkidle2', timeout: config.timeout });
-    console.log('Page loaded, extracting content...\n');
-
-    let data;
-    if (url.includes('taskcards.de')) {
-      data = await scrapeTaskCards(page, browser, shouldDownload);
-    } else {
-      data = await scrapeGeneric(page);
-    }
-
-    const screenshotPath = path.join(config.downloadDir, 'page-screenshot.png');
-    await page.screenshot({ path: screenshotPath, fullPage: true });
-    console.log(`Screenshot saved: ${screenshotPath}`);
-
-    console.log('\n=== SCRAPE RESULTS ===\n');
-    console.log(`Title: ${data.title}`);
-    if (data.cards?.length > 0) console.log(`\nCards found: ${data.cards.length}`);
-    console.log(`\nImages found: ${data.images?.length || 0}`);
-    console.log(`Links found: ${data.links?.length || 0}`);
-    console.log(`\nDownloadable files: ${data.files?.length || 0}`);
-
-    if (data.files?.length > 0) {
-      console.log('\nFiles:');
-      data.files.forEach((file, i) => console.log(`  ${i + 1}. ${file.name}`));
-    }
-
-    const resultsPath = path.join(config.downloadDir, 'scrape-results.json');
-    fs.writeFileSync(resultsPath, JSON.stringify(data, null, 2));
-    console.log(`\nFull results saved: ${resultsPath}`);
+    const data = await scrapeUrl(browser, url, {
+      shouldDownload,
+      downloadDir: config.downloadDir,
+      resultsPath: process.env.RESULTS_FILE || path.join(config.downloadDir, 'scrape-results.json'),
+      manifestPath: process.env.MANIFEST_FILE || path.join(config.downloadDir, 'manifest.bin'),
+    });
 
     if (!shouldDownload && data.files?.length > 0) {
       console.log('\nTo download files, run with: DOWNLOAD=true node scraper.js <url>');
     }
-
   } finally {
     await browser.close();
   }
@@ -0,0 +1,6 @@
+"""Allow running the CLI with ``python -m web_scraper_cli``."""
+
+from .main import cli
+
+if __name__ == "__main__":
+    cli(prog_name="webscrape")
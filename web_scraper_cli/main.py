@@ -1,39 +1,265 @@
 """Web Scraper CLI - Main entry point."""
 
-import json
+import errno
+import functools
 import os
-import shutil
-import subprocess
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
-from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
-from rich.tree import Tree
 
 from . import __version__
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.table import Column, Table
+
 
 SCRAPER_DIR = Path(__file__).parent.parent / "scraper"
-DEFAULT_OUTPUT_DIR = Path.home() / "Downloads" / "web-scraper"
+PARALLEL_MOVE_THRESHOLD = 4
+STDERR_TAIL_BYTES = 4096
+SCRAPER_TIMEOUT = 300
+DAEMON_START_TIMEOUT = 60
+DAEMON_REPLY_GRACE = 10
+MANIFEST_MAGIC = b"WSM1"
+
+_deps_ok_cached: tuple[float, bool] | None = None
+
+
+@functools.lru_cache(maxsize=1)
+def _default_output_dir() -> Path:
+    """Return the default download directory, resolving ~ on first use."""
+    return Path.home() / "Downloads" / "web-scraper"
+
+
+@functools.lru_cache(maxsize=1)
+def _cache_dir() -> Path:
+    """Return the per-user cache directory for probe results and the daemon."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "web-scraper-cli"
+
+
+def _env_probe_file() -> Path:
+    """Return the path of the persisted environment probe."""
+    return _cache_dir() / "env.json"
+
+
+def _daemon_socket() -> Path:
+    """Return the Unix socket path the scraper daemon listens on."""
+    return _cache_dir() / "daemon.sock"
+
+
+@functools.lru_cache(maxsize=1)
+def _get_console() -> "Console":
+    """Return the shared console, creating it on first use.
+
+    rich is imported here rather than at module level so that shell
+    completion and ``--version`` never load it.
+    """
+    from rich.console import Console
+
+    return Console()
+
+
+def __getattr__(name: str):
+    """Keep ``main.console`` available without creating it at import time."""
+    if name == "console":
+        return _get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class ScraperError(RuntimeError):
     """Raised when the scraper subprocess fails or returns no results."""
 
 
+@dataclass
+class ScrapeResults:
+    """The parts of scrape-results.json that the CLI displays.
+
+    Normally filled by ``load_manifest`` from manifest.bin, so the cards,
+    images and links are never built as Python objects; ``from_dict`` is
+    only for the scrape-results.json fallback.
+    """
+
+    title: str = "Unknown Page"
+    cards: int = 0
+    images: int = 0
+    links: int = 0
+    file_names: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ScrapeResults":
+        """Build results from a fully parsed scrape-results.json."""
+        return cls(
+            title=data.get("title", "Unknown Page"),
+            cards=len(data.get("cards", [])),
+            images=len(data.get("images", [])),
+            links=len(data.get("links", [])),
+            file_names=[f.get("name", "unknown") for f in data.get("files", [])],
+        )
+
+
+def load_manifest(manifest_file: Path) -> ScrapeResults:
+    """Read the binary results summary written by scraper.js.
+
+    Layout (little-endian): ``WSM1``, u16 title length and title, u32 counts
+    of cards, files, images and links, then a u16 length and name per file.
+
+    Raises:
+        ScraperError: If the manifest is truncated or malformed.
+    """
+    import mmap
+    import struct
+
+    def read_str(mm: mmap.mmap, offset: int) -> tuple[str, int]:
+        (length,) = struct.unpack_from("<H", mm, offset)
+        start = offset + 2
+        return mm[start:start + length].decode("utf-8", errors="replace"), start + length
+
+    try:
+        with open(manifest_file, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm[:4] != MANIFEST_MAGIC:
+                raise ScraperError("Invalid scraper manifest: bad header")
+            title, offset = read_str(mm, 4)
+            cards, n_files, images, links = struct.unpack_from("<4I", mm, offset)
+            offset += 16
+            file_names = []
+            for _ in range(n_files):
+                name, offset = read_str(mm, offset)
+                file_names.append(name)
+            if offset > len(mm):
+                raise ScraperError("Invalid scraper manifest: truncated")
+    except (ValueError, struct.error) as e:
+        raise ScraperError(f"Invalid scraper manifest: {e}")
+
+    return ScrapeResults(title, cards, images, links, file_names)
+
+
+def load_results(results_file: Path) -> ScrapeResults:
+    """Parse a scrape-results.json file.
+
+    Only used when the scraper did not write manifest.bin. With the optional
+    orjson package (the ``fast`` extra) the file is parsed straight from the
+    mapped pages, so it is never copied into a bytes object; otherwise the
+    stdlib json module parses the raw bytes.
+
+    Raises:
+        ScraperError: If the file is not valid JSON.
+    """
+    import mmap
+
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+
+    with open(results_file, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise ScraperError("Invalid scraper output: empty results file")
+        try:
+            if orjson is None:
+                import json
+
+                return ScrapeResults.from_dict(json.loads(f.read()))
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return ScrapeResults.from_dict(orjson.loads(view))
+        except ValueError as e:
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError (a ValueError).
+            raise ScraperError(f"Invalid scraper output: {e}")
+
+
+def _env_probe_key() -> str:
+    """Return a key identifying the current PATH and scraper install."""
+    import hashlib
+
+    raw = f"{os.environ.get('PATH', '')}\0{SCRAPER_DIR}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+@functools.lru_cache(maxsize=1)
+def _read_env_probe() -> dict:
+    """Read the persisted environment probe, or {} if missing or stale."""
+    import json
+
+    try:
+        probe = json.loads(_env_probe_file().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(probe, dict) or probe.get("key") != _env_probe_key():
+        return {}
+    return probe
+
+
+def _persist_env_probe(**fields) -> None:
+    """Merge successful probe results into the persisted environment probe.
+
+    The probe is only a cache, so write failures are ignored.
+    """
+    import json
+
+    probe = {**_read_env_probe(), **fields, "key": _env_probe_key()}
+    probe_file = _env_probe_file()
+    try:
+        probe_file.parent.mkdir(parents=True, exist_ok=True)
+        probe_file.write_text(json.dumps(probe), encoding="utf-8")
+    except OSError:
+        pass
+    _read_env_probe.cache_clear()
+
+
+@functools.lru_cache(maxsize=1)
 def check_node_installed() -> bool:
     """Check if Node.js is installed."""
-    return shutil.which("node") is not None
+    import shutil
+
+    node = _read_env_probe().get("node")
+    if node and os.access(node, os.X_OK):
+        return True
+
+    node = shutil.which("node")
+    if node is not None:
+        _persist_env_probe(node=node)
+    return node is not None
 
 
 def check_npm_dependencies() -> bool:
-    """Check if npm dependencies are installed."""
+    """Check if npm dependencies are installed.
+
+    The result is cached in-process and in the persisted probe, keyed by the
+    mtime of ``node_modules``; installing or removing packages invalidates it.
+
+    Raises:
+        click.ClickException: If ``node_modules`` exists but can't be read.
+    """
+    global _deps_ok_cached
+
     node_modules = SCRAPER_DIR / "node_modules"
-    return node_modules.exists() and (node_modules / "puppeteer").exists()
+    try:
+        deps_mtime = node_modules.stat().st_mtime
+    except FileNotFoundError:
+        return False
+    except OSError as e:
+        raise click.ClickException(f"Cannot read {node_modules}: {e}")
+
+    if _deps_ok_cached is not None and _deps_ok_cached[0] == deps_mtime:
+        return _deps_ok_cached[1]
+
+    if _read_env_probe().get("deps_mtime") == deps_mtime:
+        installed = True
+    else:
+        try:
+            installed = (node_modules / "puppeteer" / "package.json").stat().st_size > 0
+        except FileNotFoundError:
+            installed = False
+        except OSError as e:
+            raise click.ClickException(f"Cannot read {node_modules}: {e}")
+        if installed:
+            _persist_env_probe(deps_mtime=deps_mtime)
+
+    _deps_ok_cached = (deps_mtime, installed)
+    return installed
 
 
 def install_npm_dependencies() -> None:
@@ -42,7 +268,9 @@ def install_npm_dependencies() -> None:
     Raises:
         ScraperError: If npm install fails.
     """
-    console.print("[yellow]Installing Puppeteer dependencies...[/yellow]")
+    import subprocess
+
+    _get_console().print("[yellow]Installing Puppeteer dependencies...[/yellow]")
     try:
         result = subprocess.run(
             ["npm", "install"],
@@ -57,103 +285,414 @@ def install_npm_dependencies() -> None:
         raise ScraperError(f"npm install failed: {result.stderr}")
 
 
-def run_scraper(url: str, download: bool, debug: bool, output_dir: Path) -> dict:
-    """Run the Puppeteer scraper and return results.
+def scraper_work_dir(url: str) -> Path:
+    """Return the per-URL directory the scraper writes downloads and results to.
+
+    Each URL gets its own directory so concurrent scrapes never share
+    ``scrape-results.json`` or race on each other's downloads.
+    """
+    import hashlib
+
+    digest = hashlib.sha1(url.encode("utf-8")).hexdigest()[:12]
+    return SCRAPER_DIR / "downloads" / digest
+
+
+def prune_work_dirs(keep: set[Path]) -> None:
+    """Remove work directories left behind by earlier runs.
+
+    Directories younger than SCRAPER_TIMEOUT may belong to a scrape that is
+    still running in another process, so they are left alone.
+    """
+    import shutil
+
+    downloads = SCRAPER_DIR / "downloads"
+    cutoff = time.time() - SCRAPER_TIMEOUT
+    try:
+        entries = list(os.scandir(downloads))
+    except FileNotFoundError:
+        return
+
+    for entry in entries:
+        if (
+            len(entry.name) == 12
+            and entry.is_dir(follow_symlinks=False)
+            and Path(entry.path) not in keep
+            and entry.stat(follow_symlinks=False).st_mtime < cutoff
+        ):
+            shutil.rmtree(entry.path, ignore_errors=True)
+
+
+def _daemon_request(message: dict, timeout: float) -> dict | None:
+    """Send one request to the scraper daemon and return its reply.
+
+    Returns None if no daemon can be reached: any error while connecting
+    (missing or stale socket, permissions, a socket path too long for
+    AF_UNIX) means the caller should fall back to a scraper process.
 
     Raises:
-        ScraperError: If the scraper fails, times out, or produces no results.
+        ScraperError: If the daemon times out, drops the connection or sends
+            an invalid reply.
+    """
+    import json
+    import socket
+
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        try:
+            sock.connect(str(_daemon_socket()))
+        except OSError:
+            return None
+
+        try:
+            sock.sendall(json.dumps(message).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as f:
+                line = f.readline()
+        except TimeoutError:
+            raise ScraperError(f"Scraper daemon timed out after {timeout:g} seconds")
+        except OSError as e:
+            raise ScraperError(f"Scraper daemon connection failed: {e}")
+
+    try:
+        return json.loads(line)
+    except ValueError:
+        raise ScraperError("Scraper daemon closed the connection without replying")
+
+
+async def _daemon_request_async(message: dict, timeout: float) -> dict | None:
+    """Async version of ``_daemon_request`` for use inside the event loop.
+
+    Unlike running ``_daemon_request`` in a thread, cancelling this (Ctrl-C)
+    closes the connection instead of waiting for the daemon to reply.
+    """
+    import asyncio
+    import json
+
+    if not hasattr(asyncio, "open_unix_connection"):
+        return None
+
+    try:
+        reader, writer = await asyncio.open_unix_connection(str(_daemon_socket()))
+    except OSError:
+        return None
+
+    try:
+        writer.write(json.dumps(message).encode("utf-8") + b"\n")
+        await writer.drain()
+        line = await asyncio.wait_for(reader.readline(), timeout=timeout)
+    except asyncio.TimeoutError:
+        raise ScraperError(f"Scraper daemon timed out after {timeout:g} seconds")
+    except OSError as e:
+        raise ScraperError(f"Scraper daemon connection failed: {e}")
+    finally:
+        writer.close()
+
+    try:
+        return json.loads(line)
+    except ValueError:
+        raise ScraperError("Scraper daemon closed the connection without replying")
+
+
+async def _run_scraper_process(url: str, env: dict) -> None:
+    """Run ``node scraper.js`` for one URL in a fresh browser.
+
+    Raises:
+        ScraperError: If node is missing, the scraper fails or times out.
     """
-    env = {
-        **os.environ,
-        **({"DOWNLOAD": "true"} if download else {}),
-        **({"DEBUG": "true"} if debug else {}),
-    }
+    import asyncio
 
     scraper_path = SCRAPER_DIR / "scraper.js"
 
     try:
-        result = subprocess.run(
-            ["node", str(scraper_path), url],
+        proc = await asyncio.create_subprocess_exec(
+            "node", str(scraper_path), url,
             cwd=SCRAPER_DIR,
-            capture_output=True,
-            text=True,
             env=env,
-            timeout=300,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
         )
-    except subprocess.TimeoutExpired:
-        raise ScraperError("Scraper timed out after 5 minutes")
     except FileNotFoundError as e:
         raise ScraperError(f"Node.js not found: {e}")
 
-    if result.returncode != 0:
-        raise ScraperError(f"Scraper error:\n{result.stderr}")
+    try:
+        _, stderr = await asyncio.wait_for(proc.communicate(), timeout=SCRAPER_TIMEOUT)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise ScraperError(f"Scraper timed out after {SCRAPER_TIMEOUT:g} seconds")
+
+    if proc.returncode != 0:
+        tail = stderr[-STDERR_TAIL_BYTES:].decode("utf-8", errors="replace")
+        raise ScraperError(f"Scraper error:\n{tail}")
+
+
+async def run_scraper_async(
+    url: str,
+    download: bool,
+    debug: bool,
+    output_dir: Path,
+    claimed_names: set[str] | None = None,
+) -> ScrapeResults:
+    """Run the Puppeteer scraper and return results.
+
+    Uses the scraper daemon when one is running, so the browser is already
+    warm; otherwise (and always with ``debug``) starts a scraper process.
+    ``claimed_names`` is shared between concurrent scrapes so their
+    downloads don't overwrite each other in ``output_dir``.
 
-    results_file = SCRAPER_DIR / "downloads" / "scrape-results.json"
-    if not results_file.exists():
+    Raises:
+        ScraperError: If the scraper fails, times out, or produces no results.
+    """
+    import asyncio
+
+    work_dir = scraper_work_dir(url)
+    results_file = work_dir / "scrape-results.json"
+    manifest_file = work_dir / "manifest.bin"
+    results_file.unlink(missing_ok=True)
+    manifest_file.unlink(missing_ok=True)
+
+    reply = None
+    if not debug:
+        request = {
+            "url": url,
+            "download": download,
+            "downloadDir": str(work_dir),
+            "resultsFile": str(results_file),
+            "manifestFile": str(manifest_file),
+            "timeout": SCRAPER_TIMEOUT,
+        }
+        # The daemon enforces the timeout itself; wait a little longer so its
+        # error reply arrives before we give up.
+        reply = await _daemon_request_async(request, SCRAPER_TIMEOUT + DAEMON_REPLY_GRACE)
+
+    if reply is None:
+        extra = {
+            "DOWNLOAD_DIR": str(work_dir),
+            "RESULTS_FILE": str(results_file),
+            "MANIFEST_FILE": str(manifest_file),
+        }
+        if download:
+            extra["DOWNLOAD"] = "true"
+        if debug:
+            extra["DEBUG"] = "true"
+        await _run_scraper_process(url, os.environ | extra)
+    elif not reply.get("ok"):
+        raise ScraperError(f"Scraper error:\n{reply.get('error', 'unknown error')}")
+
+    if manifest_file.exists():
+        data = load_manifest(manifest_file)
+    elif results_file.exists():
+        data = load_results(results_file)
+    else:
         raise ScraperError("Scraper produced no results file")
 
+    if download and data.file_names:
+        # Names are claimed here, on the loop thread; only the file I/O runs
+        # in a worker so it doesn't stall the other scrapes.
+        if claimed_names is None:
+            claimed_names = set()
+        pairs = _plan_moves(work_dir, output_dir, claimed_names)
+        await asyncio.to_thread(_move_files, pairs, output_dir)
+
+    return data
+
+
+async def run_scrapers(urls: list[str], download: bool, debug: bool, output_dir: Path) -> list:
+    """Scrape all URLs concurrently, at most one per CPU core at a time.
+
+    Returns one entry per URL, in order: the scrape results, or the exception
+    raised while scraping that URL.
+    """
+    import asyncio
+
+    prune_work_dirs({scraper_work_dir(url) for url in urls})
+
+    limit = asyncio.Semaphore(min(len(urls), os.cpu_count() or 1))
+    claimed_names: set[str] = set()
+
+    async def scrape_one(url: str) -> ScrapeResults:
+        async with limit:
+            return await run_scraper_async(url, download, debug, output_dir, claimed_names)
+
+    return await asyncio.gather(*(scrape_one(url) for url in urls), return_exceptions=True)
+
+
+def start_daemon() -> None:
+    """Start the scraper daemon in the background and wait until it answers.
+
+    Raises:
+        ScraperError: If node is missing or the daemon does not come up.
+    """
+    import subprocess
+
+    socket_path = _daemon_socket()
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    log_path = socket_path.with_name("daemon.log")
+
+    with open(log_path, "ab") as log:
+        try:
+            proc = subprocess.Popen(
+                ["node", str(SCRAPER_DIR / "scraper.js"), "--daemon", str(socket_path)],
+                cwd=SCRAPER_DIR,
+                stdin=subprocess.DEVNULL,
+                stdout=log,
+                stderr=subprocess.STDOUT,
+                start_new_session=True,
+            )
+        except FileNotFoundError as e:
+            raise ScraperError(f"Node.js not found: {e}")
+
+    deadline = time.monotonic() + DAEMON_START_TIMEOUT
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise ScraperError(f"Scraper daemon exited with code {proc.returncode}, see {log_path}")
+        if _daemon_request({"command": "ping"}, timeout=1) is not None:
+            return
+        time.sleep(0.2)
+
+    proc.kill()
+    raise ScraperError(f"Scraper daemon did not start within {DAEMON_START_TIMEOUT} seconds")
+
+
+def _move_file(src: str, dest: str) -> str:
+    """Rename src to dest, copying instead when they are on different filesystems."""
+    import shutil
+
     try:
-        data = json.loads(results_file.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as e:
-        raise ScraperError(f"Invalid scraper output: {e}")
+        os.rename(src, dest)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(src, dest)
+    return dest
+
+
+def _unclaimed_name(name: str, claimed_names: set[str]) -> str:
+    """Return name, or "name (2).ext" etc. if another scrape already used it."""
+    stem, ext = os.path.splitext(name)
+    candidate = name
+    n = 2
+    while candidate in claimed_names:
+        candidate = f"{stem} ({n}){ext}"
+        n += 1
+    claimed_names.add(candidate)
+    return candidate
+
+
+def _plan_moves(
+    source_dir: Path, output_dir: Path, claimed_names: set[str]
+) -> list[tuple[str, str]]:
+    """Pick a destination for every download in the scraper work directory.
+
+    Names already in ``claimed_names`` get a " (2)", " (3)", ... suffix, and
+    the chosen names are added to it. Runs on the event loop thread in
+    ``run_scraper_async`` so concurrent scrapes never pick the same name.
+    """
+    output_str = os.fspath(output_dir)
+    skip = {"scrape-results.json", "manifest.bin", "page-screenshot.png"}
+    with os.scandir(source_dir) as entries:
+        return [
+            (entry.path, os.path.join(output_str, _unclaimed_name(entry.name, claimed_names)))
+            for entry in entries
+            if entry.name not in skip and entry.is_file(follow_symlinks=False)
+        ]
 
-    if download:
-        move_downloads_to_output(output_dir)
 
-    return data
+def _move_files(pairs: list[tuple[str, str]], output_dir: Path) -> list[str]:
+    """Move each (src, dest) pair, on a thread pool for larger batches."""
+    from concurrent.futures import ThreadPoolExecutor, as_completed
 
+    if not pairs:
+        return []
 
-def move_downloads_to_output(output_dir: Path) -> list[Path]:
-    """Move downloaded files from scraper directory to output directory."""
-    source_dir = SCRAPER_DIR / "downloads"
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    skip = {"scrape-results.json", "page-screenshot.png"}
-    moved_files = []
-    for file in source_dir.iterdir():
-        if file.name in skip or not file.is_file():
-            continue
-        dest = output_dir / file.name
-        shutil.move(file, dest)
-        moved_files.append(dest)
+    if len(pairs) < PARALLEL_MOVE_THRESHOLD:
+        return [_move_file(src, dest) for src, dest in pairs]
 
-    return moved_files
+    with ThreadPoolExecutor(max_workers=min(8, len(pairs))) as executor:
+        futures = [executor.submit(_move_file, src, dest) for src, dest in pairs]
+        return [future.result() for future in as_completed(futures)]
 
 
-def display_results(data: dict, output_dir: Path, downloaded: bool) -> None:
-    """Display scrape results using Rich."""
-    console.print()
-    console.print(Panel(f"[bold]{data.get('title', 'Unknown Page')}[/bold]", style="blue"))
+def move_downloads_to_output(
+    source_dir: Path, output_dir: Path, claimed_names: set[str] | None = None
+) -> list[str]:
+    """Move downloaded files from the scraper work directory to output directory.
 
-    table = Table(show_header=False, box=None)
-    table.add_column("Metric", style="cyan")
-    table.add_column("Value", style="green")
+    Files are renamed in place when both directories share a filesystem and
+    copied only when the rename crosses devices. Larger batches are moved on
+    a thread pool so cross-device copies can overlap.
+
+    When ``claimed_names`` is given, names already taken by other scrapes in
+    the same run get a " (2)", " (3)", ... suffix instead of being overwritten.
+
+    Returns the destination paths as strings. The output directory is only
+    created when there is something to move.
+    """
+    if claimed_names is None:
+        claimed_names = set()
+    return _move_files(_plan_moves(source_dir, output_dir, claimed_names), output_dir)
 
-    cards = data.get("cards", [])
-    files = data.get("files", [])
-    images = data.get("images", [])
-    links = data.get("links", [])
 
-    if cards:
-        table.add_row("Cards found", str(len(cards)))
+@functools.cache
+def _results_columns() -> tuple["Column", ...]:
+    """Build the results table's column definitions once per process."""
+    from rich.table import Column
+
+    return (Column("Metric", style="cyan"), Column("Value", style="green"))
+
+
+def _new_results_table() -> "Table":
+    """Return an empty results table with copies of the cached columns."""
+    from rich.table import Table
+
+    return Table(*(column.copy() for column in _results_columns()), show_header=False, box=None)
+
+
+def display_results(
+    data: ScrapeResults, output_dir: Path, downloaded: bool, screenshot: Path | None = None
+) -> None:
+    """Display scrape results using Rich.
+
+    Everything is rendered as one Group, with spacing from Padding rather
+    than blank prints, so the display costs a single print.
+    """
+    from rich.console import Group
+    from rich.padding import Padding
+    from rich.panel import Panel
+    from rich.tree import Tree
+
+    panel = Panel(f"[bold]{data.title}[/bold]", style="blue")
+    table = _new_results_table()
+
+    files = data.file_names
+
+    if data.cards:
+        table.add_row("Cards found", str(data.cards))
     table.add_row("Files found", str(len(files)))
-    table.add_row("Images found", str(len(images)))
-    table.add_row("Links found", str(len(links)))
+    table.add_row("Images found", str(data.images))
+    table.add_row("Links found", str(data.links))
 
-    console.print(table)
-    console.print()
+    renderables = [Padding(Group(panel, table), (1, 0), expand=False)]
 
     if files:
         tree = Tree("[bold]Downloadable Files[/bold]")
-        for f in files:
-            tree.add(f"[green]{f.get('name', 'unknown')}[/green]")
-        console.print(tree)
-        console.print()
+        for name in files:
+            tree.add(f"[green]{name}[/green]")
+        renderables.append(Padding(tree, (0, 0, 1, 0), expand=False))
 
     if downloaded and files:
-        console.print(f"[green]✓[/green] Files downloaded to: [cyan]{output_dir}[/cyan]")
+        renderables.append(f"[green]✓[/green] Files downloaded to: [cyan]{output_dir}[/cyan]")
     elif files:
-        console.print("[yellow]Tip:[/yellow] Use [cyan]--download[/cyan] to download files")
+        renderables.append("[yellow]Tip:[/yellow] Use [cyan]--download[/cyan] to download files")
+
+    if screenshot is not None and screenshot.exists():
+        renderables.append(f"Screenshot: [cyan]{screenshot}[/cyan]")
+
+    _get_console().print(Group(*renderables))
 
 
 @click.group()
@@ -167,7 +706,7 @@ def cli() -> None:
 
 
 @cli.command()
-@click.argument("url")
+@click.argument("urls", nargs=-1, required=True, metavar="URL...")
 @click.option(
     "-d", "--download",
     is_flag=True,
@@ -176,27 +715,32 @@ def cli() -> None:
 @click.option(
     "-o", "--output",
     type=click.Path(path_type=Path),
-    default=DEFAULT_OUTPUT_DIR,
-    help=f"Output directory for downloads (default: {DEFAULT_OUTPUT_DIR})",
+    default=None,
+    help="Output directory for downloads (default: ~/Downloads/web-scraper)",
 )
 @click.option(
     "--debug",
     is_flag=True,
     help="Show browser window for debugging",
 )
-def scrape(url: str, download: bool, output: Path, debug: bool) -> None:
-    """Scrape a URL and optionally download files.
+def scrape(urls: tuple[str, ...], download: bool, output: Path | None, debug: bool) -> None:
+    """Scrape one or more URLs and optionally download files.
 
-    URL: The webpage URL to scrape (must include http:// or https://)
+    URL: The webpage URL(s) to scrape (must include http:// or https://).
+    Multiple URLs are scraped concurrently, up to one per CPU core.
 
     \b
     Examples:
         webscrape scrape "https://taskcards.de/board/..."
         webscrape scrape "https://example.com" --download
         webscrape scrape "https://example.com" -d -o ~/Desktop/files
+        webscrape scrape "https://example.com/a" "https://example.com/b"
     """
-    if not url.startswith(("http://", "https://")):
-        raise click.ClickException("URL must start with http:// or https://")
+    urls = list(dict.fromkeys(urls))
+    output = output or _default_output_dir()
+    for url in urls:
+        if not url.startswith(("http://", "https://")):
+            raise click.ClickException(f"URL must start with http:// or https://: {url}")
 
     if not check_node_installed():
         raise click.ClickException("Node.js is not installed. Please install Node.js first.")
@@ -207,43 +751,108 @@ def scrape(url: str, download: bool, output: Path, debug: bool) -> None:
         except ScraperError as e:
             raise click.ClickException(str(e))
 
+    import asyncio
+
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    description = "Scraping page..." if len(urls) == 1 else f"Scraping {len(urls)} pages..."
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
-        console=console,
+        console=_get_console(),
     ) as progress:
-        progress.add_task("Scraping page...", total=None)
-        try:
-            data = run_scraper(url, download, debug, output)
-        except ScraperError as e:
-            raise click.ClickException(str(e))
+        progress.add_task(description, total=None)
+        results = asyncio.run(run_scrapers(urls, download, debug, output))
 
-    display_results(data, output, download)
+    errors = []
+    for url, result in zip(urls, results):
+        if isinstance(result, ScraperError):
+            errors.append(str(result) if len(urls) == 1 else f"{url}: {result}")
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            screenshot = scraper_work_dir(url) / "page-screenshot.png"
+            display_results(result, output, download, screenshot)
+
+    if errors:
+        raise click.ClickException("\n".join(errors))
 
 
 @cli.command()
 def info() -> None:
     """Show information about the scraper setup."""
-    console.print()
-    console.print(Panel("[bold]Web Scraper CLI Info[/bold]", style="blue"))
+    from rich.console import Group
+    from rich.padding import Padding
+    from rich.panel import Panel
+    from rich.table import Table
+
+    panel = Panel("[bold]Web Scraper CLI Info[/bold]", style="blue")
 
     table = Table(show_header=False, box=None)
     table.add_column("Setting", style="cyan")
     table.add_column("Value")
 
     table.add_row("Scraper directory", str(SCRAPER_DIR))
-    table.add_row("Default output", str(DEFAULT_OUTPUT_DIR))
+    table.add_row("Default output", str(_default_output_dir()))
     table.add_row("Node.js installed", "✓" if check_node_installed() else "✗")
     table.add_row("Dependencies installed", "✓" if check_npm_dependencies() else "✗")
+    try:
+        daemon_status = "✓" if _daemon_request({"command": "ping"}, timeout=1) is not None else "✗"
+    except ScraperError as e:
+        daemon_status = f"✗ (not responding: {e})"
+    table.add_row("Daemon running", daemon_status)
+
+    _get_console().print(Group(
+        Padding(Group(panel, table), (1, 0), expand=False),
+        "[bold]Supported file types:[/bold]",
+        "PDF, DOC, DOCX, XLS, XLSX, PPT, PPTX, ZIP, RAR, 7Z, TAR, GZ",
+        "JPG, JPEG, PNG, GIF, WEBP, SVG, BMP",
+        "MP3, MP4, WAV, AVI, MOV, MKV",
+        "TXT, CSV, JSON, XML",
+    ))
 
-    console.print(table)
-    console.print()
 
-    console.print("[bold]Supported file types:[/bold]")
-    console.print("PDF, DOC, DOCX, XLS, XLSX, PPT, PPTX, ZIP, RAR, 7Z, TAR, GZ")
-    console.print("JPG, JPEG, PNG, GIF, WEBP, SVG, BMP")
-    console.print("MP3, MP4, WAV, AVI, MOV, MKV")
-    console.print("TXT, CSV, JSON, XML")
+@cli.command()
+@click.option(
+    "--stop",
+    is_flag=True,
+    help="Stop the running daemon",
+)
+def daemon(stop: bool) -> None:
+    """Keep a headless browser running to speed up scrapes.
+
+    While the daemon runs, scrape sends requests to it instead of launching
+    a new browser for every URL. Debug scrapes still use their own browser.
+    """
+    console = _get_console()
+
+    try:
+        running = _daemon_request({"command": "stop" if stop else "ping"}, timeout=5) is not None
+    except ScraperError as e:
+        raise click.ClickException(str(e))
+
+    if stop:
+        if running:
+            console.print("[green]✓ Scraper daemon stopped.[/green]")
+        else:
+            console.print("[yellow]No scraper daemon is running.[/yellow]")
+        return
+
+    if running:
+        console.print("[green]Scraper daemon is already running.[/green]")
+        return
+
+    if not check_node_installed():
+        raise click.ClickException("Node.js is not installed. Please install Node.js first.")
+
+    try:
+        if not check_npm_dependencies():
+            install_npm_dependencies()
+        start_daemon()
+    except ScraperError as e:
+        raise click.ClickException(str(e))
+
+    console.print(f"[green]✓ Scraper daemon started[/green] on [cyan]{_daemon_socket()}[/cyan]")
 
 
 @cli.command()
@@ -252,6 +861,7 @@ def install() -> None:
     if not check_node_installed():
         raise click.ClickException("Node.js is not installed. Please install Node.js first.")
 
+    console = _get_console()
     if check_npm_dependencies():
         console.print("[green]Dependencies are already installed.[/green]")
         return